@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
 from .api import ClaudeApiClient
 from .const import CONF_SESSION_KEY, DOMAIN, PLATFORMS
-from .coordinator import ClaudeUsageCoordinator
+from .coordinator import ClaudeUsageCoordinator, cache_store
+from .history import history_store
+from .push import async_handle_webhook
+from .views import ClaudeUsageHistoryView
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Claude Usage HTTP views."""
+    hass.http.register_view(ClaudeUsageHistoryView)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -16,19 +31,67 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     session = async_get_clientsession(hass)
     client = ClaudeApiClient(session, entry.data[CONF_SESSION_KEY])
     coordinator = ClaudeUsageCoordinator(hass, client, entry)
+    await coordinator.history.async_load()
 
-    await coordinator.async_config_entry_first_refresh()
+    if not await coordinator.async_restore_cache():
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        entry.data[CONF_WEBHOOK_ID],
+        async_handle_webhook,
+        allowed_methods=["POST"],
+    )
+    entry.async_on_unload(
+        lambda: webhook.async_unregister(hass, entry.data[CONF_WEBHOOK_ID])
+    )
+    options = dict(entry.options)
+
+    async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the entry when its options change.
+
+        Data updates such as reauth already reload the entry themselves.
+        """
+        if entry.options != options:
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: ClaudeUsageCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_flush_cache()
+        await coordinator.history.async_save()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot and history when the entry is deleted."""
+    await cache_store(hass, entry.entry_id).async_remove()
+    await history_store(hass, entry.entry_id).async_remove()
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()},
+            version=2,
+        )
+
+    return True
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import aiohttp
 
-from .const import API_BASE_URL, API_ORGANIZATIONS_URL
+from .const import API_BASE_URL, API_ORGANIZATIONS_URL, REQUEST_TIMEOUT
 
 
 class ClaudeApiError(Exception):
@@ -18,10 +20,17 @@ class ClaudeApiAuthError(ClaudeApiError):
 class ClaudeApiClient:
     """Async client for the Claude.ai usage API."""
 
-    def __init__(self, session: aiohttp.ClientSession, session_key: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        session_key: str,
+        timeout: float = REQUEST_TIMEOUT,
+    ) -> None:
         """Initialize the API client."""
         self._session = session
         self._session_key = session_key
+        self._budget = timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._org_id: str | None = None
 
     @property
@@ -43,7 +52,7 @@ class ClaudeApiClient:
 
         try:
             async with self._session.get(
-                API_ORGANIZATIONS_URL, headers=self._headers
+                API_ORGANIZATIONS_URL, headers=self._headers, timeout=self._timeout
             ) as resp:
                 if resp.status in (401, 403):
                     raise ClaudeApiAuthError("Session key is invalid or expired")
@@ -52,8 +61,10 @@ class ClaudeApiClient:
                 data = await resp.json()
         except (aiohttp.ClientError, TimeoutError) as err:
             raise ClaudeApiError(f"Connection error: {err}") from err
+        except ValueError as err:
+            raise ClaudeApiError(f"Invalid JSON response: {err}") from err
 
-        if not data or not isinstance(data, list):
+        if not data or not isinstance(data, list) or not isinstance(data[0], dict):
             raise ClaudeApiError("Unexpected response format for organizations")
 
         self._org_id = data[0].get("uuid") or data[0].get("id")
@@ -63,20 +74,41 @@ class ClaudeApiClient:
         return self._org_id
 
     async def async_get_usage(self) -> dict:
-        """Fetch current usage data."""
+        """Fetch current usage data.
+
+        The organizations and usage requests share one time budget, so a
+        refresh never takes longer than the timeout in total.
+        """
+        try:
+            async with asyncio.timeout(self._budget):
+                return await self._async_fetch_usage()
+        except TimeoutError as err:
+            raise ClaudeApiError(f"Timed out after {self._budget} seconds") from err
+
+    async def _async_fetch_usage(self) -> dict:
+        """Fetch the organization ID if needed, then the usage data."""
         org_id = await self.async_get_org_id()
         url = f"{API_BASE_URL}/organizations/{org_id}/usage"
 
         try:
-            async with self._session.get(url, headers=self._headers) as resp:
+            async with self._session.get(
+                url, headers=self._headers, timeout=self._timeout
+            ) as resp:
                 if resp.status in (401, 403):
                     self._org_id = None
                     raise ClaudeApiAuthError("Session key is invalid or expired")
                 if resp.status != 200:
                     raise ClaudeApiError(f"Unexpected status {resp.status}")
-                return await resp.json()
+                data = await resp.json()
         except (aiohttp.ClientError, TimeoutError) as err:
             raise ClaudeApiError(f"Connection error: {err}") from err
+        except ValueError as err:
+            raise ClaudeApiError(f"Invalid JSON response: {err}") from err
+
+        if not isinstance(data, dict):
+            raise ClaudeApiError("Unexpected response format for usage")
+
+        return data
 
     async def async_validate_session_key(self) -> str:
         """Validate the session key by fetching the org ID. Returns org ID."""
@@ -0,0 +1,96 @@
+"""Calendar platform for Claude Usage."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from homeassistant.components.calendar import (
+    CalendarEntity,
+    CalendarEntityDescription,
+    CalendarEvent,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SESSION_WINDOW, WEEKLY_WINDOW
+from .coordinator import ClaudeUsageCoordinator
+from .entity import ClaudeUsageEntity
+from .helpers import parse_reset_time
+
+
+@dataclass(frozen=True, kw_only=True)
+class ClaudeUsageCalendarEntityDescription(CalendarEntityDescription):
+    """Describe a Claude Usage calendar entity."""
+
+    period: str
+    window: timedelta
+    summary: str
+
+
+CALENDAR_DESCRIPTIONS: tuple[ClaudeUsageCalendarEntityDescription, ...] = (
+    ClaudeUsageCalendarEntityDescription(
+        key="session_window",
+        name="Current session window",
+        icon="mdi:timer-sand",
+        period="five_hour",
+        window=SESSION_WINDOW,
+        summary="Claude session window",
+    ),
+    ClaudeUsageCalendarEntityDescription(
+        key="weekly_window",
+        name="Weekly limit window",
+        icon="mdi:calendar-week",
+        period="seven_day",
+        window=WEEKLY_WINDOW,
+        summary="Claude weekly window",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Claude Usage calendar entities."""
+    coordinator: ClaudeUsageCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        ClaudeUsageCalendar(coordinator, description, entry)
+        for description in CALENDAR_DESCRIPTIONS
+    )
+
+
+class ClaudeUsageCalendar(ClaudeUsageEntity, CalendarEntity):
+    """Calendar exposing the current usage window as an event."""
+
+    entity_description: ClaudeUsageCalendarEntityDescription
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current usage window."""
+        if self.coordinator.data is None:
+            return None
+        resets_at = parse_reset_time(
+            self.coordinator.data, self.entity_description.period
+        )
+        if resets_at is None:
+            return None
+        return CalendarEvent(
+            start=resets_at - self.entity_description.window,
+            end=resets_at,
+            summary=self.entity_description.summary,
+            uid=f"{self.unique_id}_{resets_at.isoformat()}",
+        )
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the usage window if it overlaps the requested range."""
+        if (event := self.event) is None:
+            return []
+        if event.end <= start_date or event.start >= end_date:
+            return []
+        return [event]
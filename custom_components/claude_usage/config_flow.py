@@ -7,11 +7,28 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.components import webhook
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import ClaudeApiAuthError, ClaudeApiClient, ClaudeApiError
-from .const import CONF_SESSION_KEY, DOMAIN
+from .const import (
+    CONF_PUSH_WINDOW,
+    CONF_SESSION_KEY,
+    DEFAULT_PUSH_WINDOW,
+    DOMAIN,
+    UPDATE_INTERVAL,
+)
+
+# A push window shorter than the poll interval would poll more, not less
+MIN_PUSH_WINDOW = int(UPDATE_INTERVAL.total_seconds() // 60)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +40,13 @@ SESSION_KEY_SCHEMA = vol.Schema(
 class ClaudeUsageConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Claude Usage."""
 
-    VERSION = 1
+    VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return ClaudeUsageOptionsFlow()
 
     async def _async_validate_session_key(
         self, session_key: str
@@ -59,7 +82,10 @@ class ClaudeUsageConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
                     title="Claude Usage",
-                    data=user_input,
+                    data={
+                        **user_input,
+                        CONF_WEBHOOK_ID: webhook.async_generate_id(),
+                    },
                 )
 
         return self.async_show_form(
@@ -95,3 +121,33 @@ class ClaudeUsageConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=SESSION_KEY_SCHEMA,
             errors=errors,
         )
+
+
+class ClaudeUsageOptionsFlow(OptionsFlow):
+    """Handle options for Claude Usage."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the push window."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PUSH_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_PUSH_WINDOW, DEFAULT_PUSH_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=MIN_PUSH_WINDOW))
+                }
+            ),
+            description_placeholders={
+                "webhook_path": webhook.async_generate_path(
+                    self.config_entry.data[CONF_WEBHOOK_ID]
+                )
+            },
+        )
@@ -5,10 +5,27 @@ from datetime import timedelta
 DOMAIN = "claude_usage"
 
 CONF_SESSION_KEY = "session_key"
+CONF_PUSH_WINDOW = "push_window"
 
 API_BASE_URL = "https://claude.ai/api"
 API_ORGANIZATIONS_URL = f"{API_BASE_URL}/organizations"
 
 UPDATE_INTERVAL = timedelta(minutes=5)
+# Seconds allowed for a whole refresh, organizations and usage calls combined
+REQUEST_TIMEOUT = 30
 
-PLATFORMS = ["sensor"]
+STORAGE_VERSION = 1
+CACHE_MAX_AGE = UPDATE_INTERVAL
+CACHE_SAVE_DELAY = 10
+
+HISTORY_STORAGE_VERSION = 1
+HISTORY_RETENTION = timedelta(days=400)
+HISTORY_SAVE_DELAY = 60
+
+# Minutes after a webhook push during which polling is held off
+DEFAULT_PUSH_WINDOW = 15
+
+SESSION_WINDOW = timedelta(hours=5)
+WEEKLY_WINDOW = timedelta(days=7)
+
+PLATFORMS = ["calendar", "sensor"]
@@ -2,19 +2,37 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import ClaudeApiAuthError, ClaudeApiClient, ClaudeApiError
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import (
+    CACHE_MAX_AGE,
+    CACHE_SAVE_DELAY,
+    CONF_PUSH_WINDOW,
+    DEFAULT_PUSH_WINDOW,
+    DOMAIN,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
+from .history import UsageHistory
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Return the store holding the last usage snapshot for an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
 class ClaudeUsageCoordinator(DataUpdateCoordinator[dict]):
     """Coordinator that polls Claude.ai usage data every 5 minutes."""
 
@@ -30,12 +48,88 @@ class ClaudeUsageCoordinator(DataUpdateCoordinator[dict]):
             config_entry=entry,
         )
         self.client = client
+        self.webhook_id: str = entry.data[CONF_WEBHOOK_ID]
+        self._push_window = timedelta(
+            minutes=entry.options.get(CONF_PUSH_WINDOW, DEFAULT_PUSH_WINDOW)
+        )
+        self.history = UsageHistory(hass, entry.entry_id)
+        self._store = cache_store(hass, entry.entry_id)
+        self._snapshot: dict | None = None
+        self._pushes = 0
+
+    async def async_restore_cache(self) -> bool:
+        """Serve the stored snapshot if it is still fresh.
+
+        The next poll is scheduled from the original fetch or push time, so
+        reloads cost no requests while the snapshot is fresh. Returns whether
+        the cache was used.
+        """
+        cached = await self._store.async_load()
+        if not cached or not isinstance(cached.get("data"), dict):
+            return False
+        fetched_at = dt_util.parse_datetime(cached.get("fetched_at") or "")
+        if fetched_at is None:
+            return False
+        age = dt_util.utcnow() - fetched_at
+        if cached.get("pushed"):
+            max_age = interval = self._push_window
+        else:
+            max_age, interval = CACHE_MAX_AGE, UPDATE_INTERVAL
+        if not timedelta(0) <= age < max_age:
+            return False
+
+        _LOGGER.debug("Using usage data cached %s ago", age)
+        self.update_interval = max(interval - age, timedelta(0))
+        self.async_set_updated_data(cached["data"])
+        return True
+
+    @callback
+    def async_push_data(self, data: dict) -> None:
+        """Accept usage data pushed from a fresher source.
+
+        Polling is held off until no push has arrived for the push window.
+        """
+        self._pushes += 1
+        self.update_interval = self._push_window
+        self.async_set_updated_data(data)
+        self.history.async_record(data)
+        self._async_schedule_cache_save(data, pushed=True)
+
+    @callback
+    def _async_schedule_cache_save(self, data: dict, pushed: bool = False) -> None:
+        """Store a snapshot with the time it was received.
+
+        The write is delayed so bursts of updates cost one disk write, and
+        runs outside the fetch so a failing disk cannot fail a poll.
+        """
+        self._snapshot = {
+            "fetched_at": dt_util.utcnow().isoformat(),
+            "pushed": pushed,
+            "data": data,
+        }
+        self._store.async_delay_save(lambda: self._snapshot, CACHE_SAVE_DELAY)
+
+    async def async_flush_cache(self) -> None:
+        """Write any pending snapshot now, so a reload can reuse it."""
+        if self._snapshot is not None:
+            await self._store.async_save(self._snapshot)
 
     async def _async_update_data(self) -> dict:
         """Fetch usage data from the API."""
+        self.update_interval = UPDATE_INTERVAL
+        pushes = self._pushes
         try:
-            return await self.client.async_get_usage()
+            data = await self.client.async_get_usage()
         except ClaudeApiAuthError as err:
             raise ConfigEntryAuthFailed(str(err)) from err
         except ClaudeApiError as err:
             raise UpdateFailed(str(err)) from err
+
+        if self._pushes != pushes:
+            # A push landed while this poll was in flight and is fresher
+            _LOGGER.debug("Dropping poll result superseded by a push")
+            return self.data
+
+        self.history.async_record(data)
+        self._async_schedule_cache_save(data)
+        return data
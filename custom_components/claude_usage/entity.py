@@ -0,0 +1,34 @@
+"""Base entity for Claude Usage."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import ClaudeUsageCoordinator
+
+
+class ClaudeUsageEntity(CoordinatorEntity[ClaudeUsageCoordinator]):
+    """Base entity tied to the Claude Usage service device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: ClaudeUsageCoordinator,
+        description: EntityDescription,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Claude Usage",
+            manufacturer="Anthropic",
+            entry_type=DeviceEntryType.SERVICE,
+        )
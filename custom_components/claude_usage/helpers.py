@@ -0,0 +1,15 @@
+"""Helpers shared by the Claude Usage platforms."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.util.dt import parse_datetime
+
+
+def parse_reset_time(data: dict, period: str) -> datetime | None:
+    """Parse a reset timestamp from the API response."""
+    raw = data.get(period, {}).get("resets_at")
+    if raw is None:
+        return None
+    return parse_datetime(raw)
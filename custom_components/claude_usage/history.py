@@ -0,0 +1,166 @@
+"""Compact usage history for Claude Usage."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from datetime import datetime
+import heapq
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HISTORY_RETENTION,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STORAGE_VERSION,
+)
+from .helpers import parse_reset_time
+
+PERIODS = ("five_hour", "seven_day")
+
+# Stored rows, with times in whole UTC seconds:
+#   samples: [time, five_hour, seven_day]
+#   resets:  [time, period, utilization before the reset]
+
+
+def history_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Return the store holding the usage history for an entry."""
+    return Store(hass, HISTORY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history")
+
+
+class UsageHistory:
+    """Utilization samples and reset events, kept independent of the recorder.
+
+    A sample is only recorded when utilization changes, so a quiet day costs
+    a handful of rows instead of one per poll.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the history."""
+        self._store = history_store(hass, entry_id)
+        self._samples: list[list[Any]] = []
+        self._resets: list[list[Any]] = []
+        self._last: dict | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored history."""
+        if stored := await self._store.async_load():
+            self._samples = stored.get("samples", [])
+            self._resets = stored.get("resets", [])
+            self._last = stored.get("last")
+
+    async def async_save(self) -> None:
+        """Write the history now, replacing any pending delayed write."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the history in its stored form."""
+        return {"samples": self._samples, "resets": self._resets, "last": self._last}
+
+    @callback
+    def async_record(self, data: dict) -> None:
+        """Record a usage snapshot, noting any window that reset since the last."""
+        now = dt_util.utcnow()
+        timestamp = int(now.timestamp())
+        previous = self._last or {}
+        changed = False
+
+        for period in PERIODS:
+            resets_at = parse_reset_time(previous, period)
+            if (
+                resets_at is not None
+                and resets_at <= now
+                and parse_reset_time(data, period) != resets_at
+            ):
+                insort(
+                    self._resets,
+                    [
+                        int(resets_at.timestamp()),
+                        period,
+                        previous[period].get("utilization"),
+                    ],
+                    key=_time,
+                )
+                changed = True
+
+        sample = [
+            timestamp,
+            *(data.get(period, {}).get("utilization") for period in PERIODS),
+        ]
+        if not self._samples or self._samples[-1][1:] != sample[1:]:
+            self._samples.append(sample)
+            changed = True
+
+        last = {
+            period: {
+                "utilization": data.get(period, {}).get("utilization"),
+                "resets_at": data.get(period, {}).get("resets_at"),
+            }
+            for period in PERIODS
+        }
+        if last != self._last:
+            self._last = last
+            changed = True
+        if self._prune(timestamp - int(HISTORY_RETENTION.total_seconds())):
+            changed = True
+        if changed:
+            self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+
+    @callback
+    def _prune(self, cutoff: int) -> bool:
+        """Drop rows older than the cutoff, returning whether any were dropped."""
+        samples = bisect_left(self._samples, cutoff, key=_time)
+        resets = bisect_left(self._resets, cutoff, key=_time)
+        del self._samples[:samples]
+        del self._resets[:resets]
+        return bool(samples or resets)
+
+    def iter_rows(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield samples and resets in time order within [start, end)."""
+        # Rows are whole seconds, so rounding both bounds up keeps the range
+        # exact: t >= start iff t >= ceil(start), t < end iff t < ceil(end).
+        low = math.ceil(start.timestamp()) if start is not None else None
+        high = math.ceil(end.timestamp()) if end is not None else None
+
+        def _window(rows: list[list[Any]]) -> list[list[Any]]:
+            # Slicing snapshots the rows, so recording while a caller is
+            # still iterating cannot shift or prune them underneath it.
+            first = 0 if low is None else bisect_left(rows, low, key=_time)
+            last = len(rows) if high is None else bisect_left(rows, high, key=_time)
+            return rows[first:last]
+
+        for row in heapq.merge(
+            _window(self._samples), _window(self._resets), key=_time
+        ):
+            if isinstance(row[1], str):
+                yield {
+                    "time": _isoformat(row[0]),
+                    "event": "reset",
+                    "period": row[1],
+                    "utilization": row[2],
+                }
+            else:
+                yield {
+                    "time": _isoformat(row[0]),
+                    "event": "sample",
+                    "five_hour": row[1],
+                    "seven_day": row[2],
+                }
+
+
+def _time(row: list[Any]) -> int:
+    """Return the timestamp of a stored row."""
+    return row[0]
+
+
+def _isoformat(timestamp: int) -> str:
+    """Format a stored timestamp as UTC ISO 8601."""
+    return dt_util.utc_from_timestamp(timestamp).isoformat()
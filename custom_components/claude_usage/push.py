@@ -0,0 +1,84 @@
+"""Webhook push ingestion for Claude Usage."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+import math
+
+from aiohttp import web
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import parse_datetime
+
+from .const import DOMAIN
+from .coordinator import ClaudeUsageCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _timestamp(value: object) -> str:
+    """Validate an ISO 8601 timestamp with an offset, keeping it as a string."""
+    if not isinstance(value, str):
+        raise vol.Invalid("expected an ISO 8601 timestamp")
+    try:
+        parsed = parse_datetime(value, raise_on_error=True)
+    except ValueError as err:
+        raise vol.Invalid("expected an ISO 8601 timestamp") from err
+    if parsed.tzinfo is None:
+        raise vol.Invalid("expected a timestamp with a UTC offset")
+    return value
+
+
+def _finite(value: float) -> float:
+    """Reject NaN and infinite values, which entities cannot represent."""
+    if not math.isfinite(value):
+        raise vol.Invalid("expected a finite number")
+    return value
+
+
+_WINDOW_SCHEMA = vol.Schema(
+    {
+        vol.Required("utilization"): vol.Any(
+            None, vol.All(vol.Coerce(float), _finite, vol.Range(min=0))
+        ),
+        vol.Required("resets_at"): vol.Any(None, _timestamp),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+USAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("five_hour"): _WINDOW_SCHEMA,
+        vol.Required("seven_day"): _WINDOW_SCHEMA,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_handle_webhook(
+    hass: HomeAssistant, webhook_id: str, request: web.Request
+) -> web.Response:
+    """Feed a pushed usage payload into the matching coordinator."""
+    coordinator: ClaudeUsageCoordinator | None = next(
+        (
+            coordinator
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            if coordinator.webhook_id == webhook_id
+        ),
+        None,
+    )
+    if coordinator is None:
+        return web.Response(status=HTTPStatus.NOT_FOUND)
+
+    try:
+        data = USAGE_SCHEMA(await request.json())
+    except ValueError:
+        return web.Response(status=HTTPStatus.BAD_REQUEST, text="Invalid JSON")
+    except vol.Invalid as err:
+        _LOGGER.debug("Rejected pushed usage payload: %s", err)
+        return web.Response(status=HTTPStatus.BAD_REQUEST, text=str(err))
+
+    coordinator.async_push_data(data)
+    return web.Response(status=HTTPStatus.OK)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,15 +13,25 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util.dt import parse_datetime
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import ClaudeUsageCoordinator
+from .entity import ClaudeUsageEntity
+from .helpers import parse_reset_time
+
+# Countdown update step by remaining time: coarse far from the reset,
+# fine close to it. Each step divides the one above it so updates stay
+# aligned to whole steps before the reset.
+COUNTDOWN_STEPS: tuple[tuple[timedelta, timedelta], ...] = (
+    (timedelta(days=1), timedelta(hours=1)),
+    (timedelta(hours=2), timedelta(minutes=15)),
+    (timedelta(0), timedelta(minutes=1)),
+)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -31,12 +41,58 @@ class ClaudeUsageSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[dict], float | datetime | None]
 
 
-def _parse_reset_time(data: dict, period: str) -> datetime | None:
-    """Parse a reset timestamp from the API response."""
-    raw = data.get(period, {}).get("resets_at")
-    if raw is None:
+@dataclass(frozen=True, kw_only=True)
+class ClaudeUsageTimerSensorEntityDescription(SensorEntityDescription):
+    """Describe a Claude Usage sensor that also changes as time passes."""
+
+    period: str
+    value_fn: Callable[[dict, str, datetime], float | None]
+    next_update_fn: Callable[[datetime, datetime], datetime | None]
+
+
+def _countdown_step(remaining: timedelta) -> timedelta:
+    """Return the countdown step for the time left until the reset."""
+    return next(step for above, step in COUNTDOWN_STEPS if remaining > above)
+
+
+def _countdown_minutes(data: dict, period: str, now: datetime) -> float | None:
+    """Return minutes left until the period resets, rounded up to the step."""
+    resets_at = parse_reset_time(data, period)
+    if resets_at is None:
+        return None
+    remaining = resets_at - now
+    if remaining <= timedelta(0):
+        return 0
+    step = _countdown_step(remaining)
+    steps_left = (remaining - timedelta(microseconds=1)) // step + 1
+    return steps_left * step // timedelta(minutes=1)
+
+
+def _headroom(data: dict, period: str, now: datetime) -> float | None:
+    """Return the utilization left in the period, full once it has reset."""
+    utilization = data.get(period, {}).get("utilization")
+    if utilization is None:
         return None
-    return parse_datetime(raw)
+    resets_at = parse_reset_time(data, period)
+    if resets_at is not None and resets_at <= now:
+        return 100.0
+    return max(0.0, 100.0 - utilization)
+
+
+def _next_countdown_update(now: datetime, resets_at: datetime) -> datetime | None:
+    """Return the next step boundary before the reset, or None once reset."""
+    remaining = resets_at - now
+    if remaining <= timedelta(0):
+        return None
+    step = _countdown_step(remaining)
+    return resets_at - step * ((remaining - timedelta(microseconds=1)) // step)
+
+
+def _next_reset_update(now: datetime, resets_at: datetime) -> datetime | None:
+    """Return the reset time itself, or None once reset."""
+    if resets_at <= now:
+        return None
+    return resets_at
 
 
 SENSOR_DESCRIPTIONS: tuple[ClaudeUsageSensorEntityDescription, ...] = (
@@ -63,14 +119,59 @@ SENSOR_DESCRIPTIONS: tuple[ClaudeUsageSensorEntityDescription, ...] = (
         name="Current session reset",
         icon="mdi:timer-refresh-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda data: _parse_reset_time(data, "five_hour"),
+        value_fn=lambda data: parse_reset_time(data, "five_hour"),
     ),
     ClaudeUsageSensorEntityDescription(
         key="weekly_reset",
         name="Weekly limit reset",
         icon="mdi:calendar-refresh-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda data: _parse_reset_time(data, "seven_day"),
+        value_fn=lambda data: parse_reset_time(data, "seven_day"),
+    ),
+)
+
+TIMER_SENSOR_DESCRIPTIONS: tuple[ClaudeUsageTimerSensorEntityDescription, ...] = (
+    ClaudeUsageTimerSensorEntityDescription(
+        key="session_countdown",
+        name="Current session countdown",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        period="five_hour",
+        value_fn=_countdown_minutes,
+        next_update_fn=_next_countdown_update,
+    ),
+    ClaudeUsageTimerSensorEntityDescription(
+        key="weekly_countdown",
+        name="Weekly limit countdown",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        period="seven_day",
+        value_fn=_countdown_minutes,
+        next_update_fn=_next_countdown_update,
+    ),
+    ClaudeUsageTimerSensorEntityDescription(
+        key="session_headroom",
+        name="Current session headroom",
+        icon="mdi:gauge-empty",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        period="five_hour",
+        value_fn=_headroom,
+        next_update_fn=_next_reset_update,
+    ),
+    ClaudeUsageTimerSensorEntityDescription(
+        key="weekly_headroom",
+        name="Weekly limit headroom",
+        icon="mdi:gauge-empty",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        period="seven_day",
+        value_fn=_headroom,
+        next_update_fn=_next_reset_update,
     ),
 )
 
@@ -83,34 +184,21 @@ async def async_setup_entry(
     """Set up Claude Usage sensor entities."""
     coordinator: ClaudeUsageCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
+    entities: list[SensorEntity] = [
         ClaudeUsageSensor(coordinator, description, entry)
         for description in SENSOR_DESCRIPTIONS
+    ]
+    entities.extend(
+        ClaudeUsageTimerSensor(coordinator, description, entry)
+        for description in TIMER_SENSOR_DESCRIPTIONS
     )
+    async_add_entities(entities)
 
 
-class ClaudeUsageSensor(CoordinatorEntity[ClaudeUsageCoordinator], SensorEntity):
+class ClaudeUsageSensor(ClaudeUsageEntity, SensorEntity):
     """Sensor entity for Claude usage data."""
 
     entity_description: ClaudeUsageSensorEntityDescription
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: ClaudeUsageCoordinator,
-        description: ClaudeUsageSensorEntityDescription,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Claude Usage",
-            manufacturer="Anthropic",
-            entry_type=DeviceEntryType.SERVICE,
-        )
 
     @property
     def native_value(self) -> float | datetime | None:
@@ -118,3 +206,64 @@ class ClaudeUsageSensor(CoordinatorEntity[ClaudeUsageCoordinator], SensorEntity)
         if self.coordinator.data is None:
             return None
         return self.entity_description.value_fn(self.coordinator.data)
+
+
+class ClaudeUsageTimerSensor(ClaudeUsageEntity, SensorEntity):
+    """Sensor that is rewritten at point-in-time timers between polls."""
+
+    entity_description: ClaudeUsageTimerSensorEntityDescription
+    _unsub_timer: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start the timer once the entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_timer)
+        self._async_schedule_timer()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reschedule the timer against the new reset time."""
+        self._async_schedule_timer()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the pending timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_schedule_timer(self) -> None:
+        """Schedule the next state write for this sensor."""
+        self._async_cancel_timer()
+        if self.coordinator.data is None:
+            return
+        resets_at = parse_reset_time(
+            self.coordinator.data, self.entity_description.period
+        )
+        if resets_at is None:
+            return
+        next_update = self.entity_description.next_update_fn(
+            dt_util.utcnow(), resets_at
+        )
+        if next_update is not None:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._async_timer_fired, next_update
+            )
+
+    @callback
+    def _async_timer_fired(self, _now: datetime) -> None:
+        """Write the new state and schedule the following update."""
+        self._unsub_timer = None
+        self._async_schedule_timer()
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the sensor value at the current time."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(
+            self.coordinator.data, self.entity_description.period, dt_util.utcnow()
+        )
@@ -0,0 +1,84 @@
+"""HTTP views for Claude Usage."""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from http import HTTPStatus
+import io
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+HISTORY_FIELDS = ("time", "event", "period", "five_hour", "seven_day", "utilization")
+
+# Rows buffered per chunk written to the response
+CHUNK_ROWS = 500
+
+
+class ClaudeUsageHistoryView(HomeAssistantView):
+    """Stream the recorded usage history of an entry as NDJSON or CSV."""
+
+    url = "/api/claude_usage/history/{entry_id}"
+    name = "api:claude_usage:history"
+
+    async def get(self, request: web.Request, entry_id: str) -> web.StreamResponse:
+        """Stream history rows, optionally limited to a start and end time."""
+        hass = request.app[KEY_HASS]
+        if (coordinator := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+            return self.json_message("Entry not found", HTTPStatus.NOT_FOUND)
+
+        output = request.query.get("format", "ndjson")
+        if output not in ("ndjson", "csv"):
+            return self.json_message(
+                "Format must be ndjson or csv", HTTPStatus.BAD_REQUEST
+            )
+
+        bounds: dict[str, datetime | None] = {"start": None, "end": None}
+        for param in bounds:
+            if (raw := request.query.get(param)) is None:
+                continue
+            try:
+                parsed = dt_util.parse_datetime(raw, raise_on_error=True)
+            except ValueError:
+                return self.json_message(
+                    f"Invalid {param} time", HTTPStatus.BAD_REQUEST
+                )
+            bounds[param] = dt_util.as_utc(parsed)
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": (
+                    "text/csv" if output == "csv" else "application/x-ndjson"
+                )
+            }
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, HISTORY_FIELDS)
+        if output == "csv":
+            writer.writeheader()
+
+        for count, row in enumerate(
+            coordinator.history.iter_rows(bounds["start"], bounds["end"]), 1
+        ):
+            if output == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json_dumps(row) + "\n")
+            if count % CHUNK_ROWS == 0:
+                await response.write(buffer.getvalue().encode())
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            await response.write(buffer.getvalue().encode())
+        await response.write_eof()
+        return response
@@ -17,6 +17,8 @@ def enable_custom_integrations(hass: HomeAssistant) -> None:
 ORG_URL = "https://claude.ai/api/organizations"
 USAGE_URL = "https://claude.ai/api/organizations/org-test-uuid/usage"
 
+WEBHOOK_ID = "test-webhook-id"
+
 MOCK_ORG_RESPONSE = [{"uuid": "org-test-uuid"}]
 
 MOCK_USAGE_RESPONSE = {
@@ -30,10 +32,10 @@ def mock_config_entry() -> MockConfigEntry:
     """Return a mock config entry."""
     return MockConfigEntry(
         domain=DOMAIN,
-        data={"session_key": "sk-ant-test-key"},
+        data={"session_key": "sk-ant-test-key", "webhook_id": WEBHOOK_ID},
         unique_id="org-test-uuid",
         title="Claude Usage",
-        version=1,
+        version=2,
     )
 
 
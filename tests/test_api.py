@@ -0,0 +1,378 @@
+"""Fault-injection tests for the Claude API client and coordinator.
+
+A local raw HTTP server stands in for claude.ai and misbehaves in the ways
+flaky connectivity does in practice: slow or truncated bodies, resets
+mid-read, non-JSON payloads and requests that never get a response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+import json
+import time
+
+import aiohttp
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.claude_usage import api
+from custom_components.claude_usage.api import (
+    ClaudeApiAuthError,
+    ClaudeApiClient,
+    ClaudeApiError,
+)
+from custom_components.claude_usage.coordinator import ClaudeUsageCoordinator
+
+from .conftest import MOCK_ORG_RESPONSE, MOCK_USAGE_RESPONSE
+
+TIMEOUT = 0.5
+# Slack on top of the client timeout for scheduling and connection teardown.
+BUDGET = TIMEOUT + 1.0
+MAX_LOOP_LAG = 0.2
+
+ORG_PATH = "/api/organizations"
+USAGE_PATH = "/api/organizations/org-test-uuid/usage"
+
+Fault = Callable[[asyncio.StreamWriter], Awaitable[None]]
+
+
+def _head(status: int, content_type: str, length: int) -> bytes:
+    """Return a raw HTTP response head."""
+    return (
+        f"HTTP/1.1 {status} X\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {length}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode()
+
+
+def _respond(
+    body: bytes, status: int = 200, content_type: str = "application/json"
+) -> Fault:
+    """Return a fault that sends a complete response."""
+
+    async def fault(writer: asyncio.StreamWriter) -> None:
+        writer.write(_head(status, content_type, len(body)) + body)
+        await writer.drain()
+
+    return fault
+
+
+def _json(payload: object) -> Fault:
+    """Return a fault that sends a well-formed JSON response."""
+    return _respond(json.dumps(payload).encode())
+
+
+async def _slow_body(writer: asyncio.StreamWriter) -> None:
+    """Send the head promptly, then dribble the body far past the timeout."""
+    body = json.dumps(MOCK_USAGE_RESPONSE).encode()
+    writer.write(_head(200, "application/json", len(body)))
+    for byte in body:
+        writer.write(bytes([byte]))
+        await writer.drain()
+        await asyncio.sleep(0.1)
+
+
+async def _short_body(writer: asyncio.StreamWriter) -> None:
+    """Close the connection before the advertised body length is sent."""
+    body = json.dumps(MOCK_USAGE_RESPONSE).encode()
+    writer.write(_head(200, "application/json", len(body)) + body[:10])
+    await writer.drain()
+
+
+async def _reset_mid_read(writer: asyncio.StreamWriter) -> None:
+    """Abort the connection with part of the body on the wire."""
+    body = json.dumps(MOCK_USAGE_RESPONSE).encode()
+    writer.write(_head(200, "application/json", len(body)) + body[:10])
+    await writer.drain()
+    writer.transport.abort()
+
+
+async def _hang(writer: asyncio.StreamWriter) -> None:
+    """Never respond."""
+    await asyncio.Event().wait()
+
+
+def _delayed(delay: float, fault: Fault) -> Fault:
+    """Return a fault that waits before behaving like another."""
+
+    async def delayed(writer: asyncio.StreamWriter) -> None:
+        await asyncio.sleep(delay)
+        await fault(writer)
+
+    return delayed
+
+
+class FaultServer:
+    """Minimal HTTP/1.1 server that answers each path with a fault."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.routes: dict[str, Fault] = {}
+        self.open_connections = 0
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        """Return the base URL the server listens on."""
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        """Start listening on an ephemeral local port."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        """Stop listening and cancel any handler still running."""
+        assert self._server is not None
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def wait_idle(self) -> None:
+        """Wait until every client connection has been closed."""
+        async with asyncio.timeout(BUDGET):
+            while self.open_connections:
+                await asyncio.sleep(0.01)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one request, stopping early if the client hangs up."""
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        self.open_connections += 1
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            path = request.split(b" ", 2)[1].decode()
+            fault = self.routes.get(path, _respond(b"", status=404))
+            serve = asyncio.ensure_future(fault(writer))
+            closed = asyncio.ensure_future(reader.read())
+            await asyncio.wait((serve, closed), return_when=asyncio.FIRST_COMPLETED)
+            for pending in (serve, closed):
+                pending.cancel()
+            await asyncio.gather(serve, closed, return_exceptions=True)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            self.open_connections -= 1
+            self._handlers.discard(task)
+
+
+class LoopMonitor:
+    """Track the longest stall of the event loop while running."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling the event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling the event loop."""
+        assert self._task is not None
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Sleep in short ticks and record how late each wakeup was."""
+        interval = 0.01
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(interval)
+            self.max_lag = max(self.max_lag, time.monotonic() - before - interval)
+
+
+@pytest.fixture
+async def server(
+    socket_enabled: None, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[FaultServer]:
+    """Run a fault server and point the API client at it."""
+    fault_server = FaultServer()
+    await fault_server.start()
+    monkeypatch.setattr(api, "API_BASE_URL", f"{fault_server.url}/api")
+    monkeypatch.setattr(
+        api, "API_ORGANIZATIONS_URL", f"{fault_server.url}{ORG_PATH}"
+    )
+    fault_server.routes[ORG_PATH] = _json(MOCK_ORG_RESPONSE)
+    yield fault_server
+    await fault_server.stop()
+
+
+@pytest.fixture
+async def client(
+    server: FaultServer,
+) -> AsyncGenerator[ClaudeApiClient]:
+    """Return a client on its own session, closed and checked for leaks."""
+    session = aiohttp.ClientSession()
+    yield ClaudeApiClient(session, "sk-ant-test-key", timeout=TIMEOUT)
+    await session.close()
+    await server.wait_idle()
+
+
+@pytest.fixture
+async def loop_monitor() -> AsyncGenerator[LoopMonitor]:
+    """Fail the test if the event loop stalls while it runs."""
+    monitor = LoopMonitor()
+    monitor.start()
+    yield monitor
+    await monitor.stop()
+    assert monitor.max_lag < MAX_LOOP_LAG
+
+
+async def test_usage_success(server: FaultServer, client: ClaudeApiClient) -> None:
+    """Test the fault server serves a healthy round trip."""
+    server.routes[USAGE_PATH] = _json(MOCK_USAGE_RESPONSE)
+
+    assert await client.async_get_usage() == MOCK_USAGE_RESPONSE
+
+
+@pytest.mark.parametrize(
+    ("path", "fault", "error"),
+    [
+        (USAGE_PATH, _slow_body, ClaudeApiError),
+        (USAGE_PATH, _short_body, ClaudeApiError),
+        (USAGE_PATH, _reset_mid_read, ClaudeApiError),
+        (USAGE_PATH, _hang, ClaudeApiError),
+        (USAGE_PATH, _respond(b'{"five_hour": {"utiliz'), ClaudeApiError),
+        (USAGE_PATH, _respond(b"<html>Just a moment...</html>"), ClaudeApiError),
+        (
+            USAGE_PATH,
+            _respond(b"<html>Just a moment...</html>", content_type="text/html"),
+            ClaudeApiError,
+        ),
+        (USAGE_PATH, _json(["not", "a", "dict"]), ClaudeApiError),
+        (USAGE_PATH, _respond(b"", status=500), ClaudeApiError),
+        (USAGE_PATH, _respond(b"", status=401), ClaudeApiAuthError),
+        (ORG_PATH, _hang, ClaudeApiError),
+        (ORG_PATH, _slow_body, ClaudeApiError),
+        (ORG_PATH, _reset_mid_read, ClaudeApiError),
+        (ORG_PATH, _respond(b"[{"), ClaudeApiError),
+        (ORG_PATH, _json(["org-test-uuid"]), ClaudeApiError),
+        (ORG_PATH, _respond(b"", status=403), ClaudeApiAuthError),
+    ],
+)
+async def test_fault_mapping(
+    server: FaultServer,
+    client: ClaudeApiClient,
+    loop_monitor: LoopMonitor,
+    path: str,
+    fault: Fault,
+    error: type[ClaudeApiError],
+) -> None:
+    """Test each fault raises the right error within the time budget."""
+    server.routes[USAGE_PATH] = _json(MOCK_USAGE_RESPONSE)
+    server.routes[path] = fault
+
+    start = time.monotonic()
+    with pytest.raises(error) as exc_info:
+        await client.async_get_usage()
+
+    assert time.monotonic() - start < BUDGET
+    assert type(exc_info.value) is error
+    await server.wait_idle()
+
+
+async def test_refresh_shares_one_budget(
+    server: FaultServer, client: ClaudeApiClient, loop_monitor: LoopMonitor
+) -> None:
+    """Test a slow organizations call eats into the usage call's budget."""
+    server.routes[ORG_PATH] = _delayed(TIMEOUT * 0.8, _json(MOCK_ORG_RESPONSE))
+    server.routes[USAGE_PATH] = _hang
+
+    start = time.monotonic()
+    with pytest.raises(ClaudeApiError):
+        await client.async_get_usage()
+
+    # Separate per-request timeouts would allow close to twice the budget
+    assert time.monotonic() - start < TIMEOUT * 1.5
+    await server.wait_idle()
+
+
+async def test_recovers_after_fault(
+    server: FaultServer, client: ClaudeApiClient
+) -> None:
+    """Test a connection reset does not poison later requests."""
+    server.routes[USAGE_PATH] = _reset_mid_read
+    with pytest.raises(ClaudeApiError):
+        await client.async_get_usage()
+
+    server.routes[USAGE_PATH] = _json(MOCK_USAGE_RESPONSE)
+    assert await client.async_get_usage() == MOCK_USAGE_RESPONSE
+
+
+async def test_cancel_during_get_usage(
+    server: FaultServer, client: ClaudeApiClient, loop_monitor: LoopMonitor
+) -> None:
+    """Test cancelling a pending fetch propagates and drops the connection."""
+    server.routes[USAGE_PATH] = _hang
+
+    task = asyncio.create_task(client.async_get_usage())
+    async with asyncio.timeout(BUDGET):
+        while server.open_connections == 0:
+            await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await server.wait_idle()
+
+
+async def test_coordinator_hung_organizations(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    server: FaultServer,
+    client: ClaudeApiClient,
+    loop_monitor: LoopMonitor,
+) -> None:
+    """Test a hung organizations call fails the refresh within its budget."""
+    server.routes[ORG_PATH] = _hang
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ClaudeUsageCoordinator(hass, client, mock_config_entry)
+
+    start = time.monotonic()
+    await coordinator.async_refresh()
+
+    assert time.monotonic() - start < BUDGET
+    assert coordinator.last_update_success is False
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_repeated_faults(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    server: FaultServer,
+    client: ClaudeApiClient,
+    loop_monitor: LoopMonitor,
+) -> None:
+    """Test many failing refreshes leave no connections behind."""
+    mock_config_entry.add_to_hass(hass)
+    coordinator = ClaudeUsageCoordinator(hass, client, mock_config_entry)
+
+    for fault in (_reset_mid_read, _short_body, _hang, _slow_body) * 3:
+        server.routes[USAGE_PATH] = fault
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success is False
+        await server.wait_idle()
+
+    server.routes[USAGE_PATH] = _json(MOCK_USAGE_RESPONSE)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is True
+    assert coordinator.data == MOCK_USAGE_RESPONSE
+    await coordinator.async_shutdown()
@@ -0,0 +1,76 @@
+"""Tests for Claude Usage calendar entities."""
+
+from datetime import datetime
+
+import pytest
+
+from homeassistant.components.calendar import DOMAIN as CALENDAR_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .test_sensor import _get_entity_id_by_key
+
+pytestmark = pytest.mark.freeze_time("2026-02-10T12:00:00+00:00")
+
+
+def _local(value: str) -> str:
+    """Format a UTC timestamp the way calendar state attributes show it."""
+    return dt_util.as_local(datetime.fromisoformat(value)).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+
+async def test_window_events(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test each usage window is exposed as an event ending at its reset."""
+    eid = setup_integration.entry_id
+    session_id = _get_entity_id_by_key(entity_registry, eid, "session_window")
+    weekly_id = _get_entity_id_by_key(entity_registry, eid, "weekly_window")
+
+    state = hass.states.get(session_id)
+    assert state.state == "on"
+    assert state.attributes["message"] == "Claude session window"
+    assert state.attributes["start_time"] == _local("2026-02-10T10:30:00+00:00")
+    assert state.attributes["end_time"] == _local("2026-02-10T15:30:00+00:00")
+
+    state = hass.states.get(weekly_id)
+    assert state.state == "on"
+    assert state.attributes["start_time"] == _local("2026-02-10T00:00:00+00:00")
+    assert state.attributes["end_time"] == _local("2026-02-17T00:00:00+00:00")
+
+
+async def test_get_events_range(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the window is only returned for overlapping ranges."""
+    session_id = _get_entity_id_by_key(
+        entity_registry, setup_integration.entry_id, "session_window"
+    )
+
+    async def _events(start: str, end: str) -> list[dict]:
+        response = await hass.services.async_call(
+            CALENDAR_DOMAIN,
+            "get_events",
+            {
+                "start_date_time": datetime.fromisoformat(start),
+                "end_date_time": datetime.fromisoformat(end),
+            },
+            target={"entity_id": session_id},
+            blocking=True,
+            return_response=True,
+        )
+        return response[session_id]["events"]
+
+    events = await _events("2026-02-10T14:00:00+00:00", "2026-02-10T16:00:00+00:00")
+    assert len(events) == 1
+    assert events[0]["summary"] == "Claude session window"
+    assert events[0]["end"] == "2026-02-10T15:30:00+00:00"
+
+    assert await _events("2026-02-10T16:00:00+00:00", "2026-02-10T18:00:00+00:00") == []
@@ -1,6 +1,10 @@
 """Tests for the Claude Usage config flow."""
 
+from unittest.mock import patch
+
 import aiohttp
+import pytest
+import voluptuous as vol
 
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.core import HomeAssistant
@@ -8,9 +12,10 @@ from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
+from custom_components.claude_usage import async_setup_entry
 from custom_components.claude_usage.const import DOMAIN
 
-from .conftest import ORG_URL
+from .conftest import MOCK_ORG_RESPONSE, ORG_URL, WEBHOOK_ID
 
 
 async def test_full_user_flow(
@@ -31,7 +36,8 @@ async def test_full_user_flow(
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Claude Usage"
-    assert result["data"] == {"session_key": "sk-valid"}
+    assert result["data"]["session_key"] == "sk-valid"
+    assert len(result["data"]["webhook_id"]) == 64
 
     entry = hass.config_entries.async_entries(DOMAIN)[0]
     assert entry.unique_id == "org-123"
@@ -114,6 +120,29 @@ async def test_reauth_flow(
     assert mock_config_entry.data["session_key"] == "sk-new-key"
 
 
+async def test_reauth_reloads_once(
+    hass: HomeAssistant,
+    mock_api: AiohttpClientMocker,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Test reauth reloads the entry once, not again for the data update."""
+    result = await setup_integration.start_reauth_flow(hass)
+    mock_api.get(ORG_URL, json=MOCK_ORG_RESPONSE)
+
+    with patch(
+        "custom_components.claude_usage.async_setup_entry",
+        wraps=async_setup_entry,
+    ) as mock_setup_entry:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={"session_key": "sk-new-key"},
+        )
+        await hass.async_block_till_done()
+
+    assert result["reason"] == "reauth_successful"
+    assert len(mock_setup_entry.mock_calls) == 1
+
+
 async def test_reauth_invalid_auth(
     hass: HomeAssistant,
     aioclient_mock: AiohttpClientMocker,
@@ -131,3 +160,39 @@ async def test_reauth_invalid_auth(
     )
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
+
+
+async def test_options_flow(
+    hass: HomeAssistant, setup_integration: MockConfigEntry
+) -> None:
+    """Test the push window can be changed and shows the webhook path."""
+    result = await hass.config_entries.options.async_init(
+        setup_integration.entry_id
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+    assert result["description_placeholders"] == {
+        "webhook_path": f"/api/webhook/{WEBHOOK_ID}"
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"push_window": 30}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert setup_integration.options == {"push_window": 30}
+
+
+async def test_options_flow_rejects_short_window(
+    hass: HomeAssistant, setup_integration: MockConfigEntry
+) -> None:
+    """Test the push window cannot be shorter than the poll interval."""
+    result = await hass.config_entries.options.async_init(
+        setup_integration.entry_id
+    )
+
+    with pytest.raises(vol.Invalid):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], user_input={"push_window": 2}
+        )
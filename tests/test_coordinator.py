@@ -1,5 +1,6 @@
 """Tests for the Claude Usage coordinator."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -63,3 +64,32 @@ async def test_api_error_raises_update_failed(
     await coordinator.async_refresh()
 
     assert coordinator.last_update_success is False
+
+
+async def test_push_supersedes_poll_in_flight(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test a poll that finishes after a push does not overwrite it."""
+    mock_config_entry.add_to_hass(hass)
+    release = asyncio.Event()
+
+    async def _slow_usage() -> dict:
+        await release.wait()
+        return MOCK_USAGE_RESPONSE
+
+    client = AsyncMock(spec=ClaudeApiClient)
+    client.async_get_usage.side_effect = _slow_usage
+    coordinator = ClaudeUsageCoordinator(hass, client, mock_config_entry)
+
+    refresh = hass.async_create_task(coordinator.async_refresh())
+    await asyncio.sleep(0)
+
+    pushed = {**MOCK_USAGE_RESPONSE, "five_hour": {"utilization": 99.0}}
+    coordinator.async_push_data(pushed)
+    release.set()
+    await refresh
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data == pushed
+    rows = list(coordinator.history.iter_rows())
+    assert [row["five_hour"] for row in rows] == [99.0]
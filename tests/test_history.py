@@ -0,0 +1,159 @@
+"""Tests for the Claude Usage history store."""
+
+from datetime import timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.claude_usage.const import DOMAIN, HISTORY_SAVE_DELAY
+from custom_components.claude_usage.history import UsageHistory
+
+from .conftest import MOCK_USAGE_RESPONSE
+
+
+def _usage(five_hour: float, five_hour_reset: str) -> dict:
+    """Return a usage snapshot with the given 5-hour window."""
+    return {
+        **MOCK_USAGE_RESPONSE,
+        "five_hour": {"utilization": five_hour, "resets_at": five_hour_reset},
+    }
+
+
+async def _record_day(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> UsageHistory:
+    """Record a session that resets partway through."""
+    history = UsageHistory(hass, "entry")
+    freezer.move_to("2026-02-10T12:00:00+00:00")
+    history.async_record(_usage(45.0, "2026-02-10T15:30:00+00:00"))
+    freezer.move_to("2026-02-10T12:05:00+00:00")
+    history.async_record(_usage(45.0, "2026-02-10T15:30:00+00:00"))
+    freezer.move_to("2026-02-10T12:10:00+00:00")
+    history.async_record(_usage(50.0, "2026-02-10T15:30:00+00:00"))
+    freezer.move_to("2026-02-10T15:35:00+00:00")
+    history.async_record(_usage(0.0, "2026-02-10T20:35:00+00:00"))
+    return history
+
+
+async def test_records_changes_and_resets(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged polls are skipped and window resets are noted."""
+    history = await _record_day(hass, freezer)
+
+    assert list(history.iter_rows()) == [
+        {
+            "time": "2026-02-10T12:00:00+00:00",
+            "event": "sample",
+            "five_hour": 45.0,
+            "seven_day": 72.0,
+        },
+        {
+            "time": "2026-02-10T12:10:00+00:00",
+            "event": "sample",
+            "five_hour": 50.0,
+            "seven_day": 72.0,
+        },
+        {
+            "time": "2026-02-10T15:30:00+00:00",
+            "event": "reset",
+            "period": "five_hour",
+            "utilization": 50.0,
+        },
+        {
+            "time": "2026-02-10T15:35:00+00:00",
+            "event": "sample",
+            "five_hour": 0.0,
+            "seven_day": 72.0,
+        },
+    ]
+    await history.async_save()
+
+
+async def test_time_range(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test rows are limited to the half-open [start, end) range."""
+    history = await _record_day(hass, freezer)
+
+    rows = list(
+        history.iter_rows(
+            dt_util.parse_datetime("2026-02-10T12:10:00+00:00"),
+            dt_util.parse_datetime("2026-02-10T15:35:00+00:00"),
+        )
+    )
+    assert [row["time"] for row in rows] == [
+        "2026-02-10T12:10:00+00:00",
+        "2026-02-10T15:30:00+00:00",
+    ]
+    await history.async_save()
+
+
+async def test_time_range_fractional_seconds(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test bounds with fractional seconds still form [start, end)."""
+    history = await _record_day(hass, freezer)
+
+    rows = list(
+        history.iter_rows(
+            dt_util.parse_datetime("2026-02-10T12:00:00.500+00:00"),
+            dt_util.parse_datetime("2026-02-10T15:30:00.500+00:00"),
+        )
+    )
+    assert [row["time"] for row in rows] == [
+        "2026-02-10T12:10:00+00:00",
+        "2026-02-10T15:30:00+00:00",
+    ]
+    await history.async_save()
+
+
+async def test_persists_and_prunes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test history survives a reload and old rows are dropped."""
+    history = await _record_day(hass, freezer)
+    await history.async_save()
+
+    restored = UsageHistory(hass, "entry")
+    await restored.async_load()
+    assert list(restored.iter_rows()) == list(history.iter_rows())
+
+    # The last snapshot is restored too, so no duplicate sample is written
+    restored.async_record(_usage(0.0, "2026-02-10T20:35:00+00:00"))
+    assert len(list(restored.iter_rows())) == 4
+
+    freezer.tick(timedelta(days=401))
+    restored.async_record(_usage(10.0, "2027-03-18T20:00:00+00:00"))
+    rows = list(restored.iter_rows())
+    assert [row["event"] for row in rows] == ["sample"]
+    assert rows[0]["five_hour"] == 10.0
+    await restored.async_save()
+
+
+async def test_saves_only_on_change(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an unchanged snapshot does not schedule a history write."""
+    key = f"{DOMAIN}.entry.history"
+    history = await _record_day(hass, freezer)
+    await history.async_save()
+    del hass_storage[key]
+
+    history.async_record(_usage(0.0, "2026-02-10T20:35:00+00:00"))
+    freezer.tick(HISTORY_SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+    history.async_record(_usage(5.0, "2026-02-10T20:35:00+00:00"))
+    freezer.tick(HISTORY_SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["samples"][-1][1] == 5.0
@@ -1,11 +1,26 @@
 """Tests for Claude Usage integration setup and teardown."""
 
+from datetime import datetime, timedelta
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
 
-from custom_components.claude_usage.const import DOMAIN
+from custom_components.claude_usage.const import (
+    CACHE_SAVE_DELAY,
+    DOMAIN,
+    UPDATE_INTERVAL,
+)
+
+from .conftest import MOCK_USAGE_RESPONSE
 
 
 async def test_setup_entry(
@@ -45,3 +60,173 @@ async def test_setup_auth_failure(
     await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
+
+
+def _cache(entry_id: str, fetched_at: datetime, pushed: bool = False) -> dict:
+    """Return stored cache contents for an entry."""
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry_id}",
+        "data": {
+            "fetched_at": fetched_at.isoformat(),
+            "pushed": pushed,
+            "data": {
+                **MOCK_USAGE_RESPONSE,
+                "five_hour": {"utilization": 12.0, "resets_at": None},
+            },
+        },
+    }
+
+
+async def test_setup_uses_fresh_cache(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_api: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a fresh cached snapshot is served without a request."""
+    fetched_at = dt_util.utcnow() - timedelta(minutes=2)
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = _cache(
+        mock_config_entry.entry_id, fetched_at
+    )
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_api.call_count == 0
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.data["five_hour"]["utilization"] == 12.0
+
+    # The next poll is due five minutes after the original fetch
+    freezer.tick(timedelta(minutes=2, seconds=50))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 0
+
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 2
+    assert coordinator.data == MOCK_USAGE_RESPONSE
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+
+async def test_setup_keeps_push_hold_off(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_api: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a pushed snapshot keeps polling held off across a reload."""
+    fetched_at = dt_util.utcnow() - timedelta(minutes=10)
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = _cache(
+        mock_config_entry.entry_id, fetched_at, pushed=True
+    )
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 0
+
+    # The default push window holds polling off for 15 minutes after the push
+    freezer.tick(timedelta(minutes=4, seconds=50))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 0
+
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 2
+
+
+async def test_setup_ignores_stale_cache(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_api: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a snapshot older than the update interval is refetched."""
+    fetched_at = dt_util.utcnow() - timedelta(minutes=6)
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = _cache(
+        mock_config_entry.entry_id, fetched_at
+    )
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_api.call_count == 2
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.data == MOCK_USAGE_RESPONSE
+
+
+async def test_reload_skips_fetch(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    mock_api: AiohttpClientMocker,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test reloading right after a fetch reuses the stored snapshot."""
+    assert mock_api.call_count == 2
+
+    await hass.config_entries.async_reload(setup_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert setup_integration.state is ConfigEntryState.LOADED
+    assert mock_api.call_count == 2
+    assert f"{DOMAIN}.{setup_integration.entry_id}" in hass_storage
+
+
+async def test_poll_defers_cache_write(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    setup_integration: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a poll leaves the snapshot write to a later delayed save."""
+    key = f"{DOMAIN}.{setup_integration.entry_id}"
+    assert key not in hass_storage
+
+    freezer.tick(timedelta(seconds=CACHE_SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass_storage[key]["data"]["data"] == MOCK_USAGE_RESPONSE
+
+
+async def test_remove_entry_clears_cache(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test removing the entry deletes its stored snapshot."""
+    await hass.config_entries.async_remove(setup_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.{setup_integration.entry_id}" not in hass_storage
+
+
+async def test_migrate_v1_adds_webhook_id(
+    hass: HomeAssistant, mock_api: AiohttpClientMocker
+) -> None:
+    """Test version 1 entries gain a webhook ID on setup."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"session_key": "sk-ant-test-key"},
+        unique_id="org-test-uuid",
+        version=1,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.version == 2
+    assert entry.data["session_key"] == "sk-ant-test-key"
+    assert len(entry.data["webhook_id"]) == 64
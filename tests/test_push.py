@@ -0,0 +1,136 @@
+"""Tests for Claude Usage webhook push ingestion."""
+
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClientMocker
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.claude_usage.const import DOMAIN
+
+from .conftest import MOCK_USAGE_RESPONSE, WEBHOOK_ID
+
+WEBHOOK_URL = f"/api/webhook/{WEBHOOK_ID}"
+
+PUSHED_USAGE = {
+    "five_hour": {"utilization": 80.0, "resets_at": "2026-02-10T15:30:00+00:00"},
+    "seven_day": {"utilization": 90.0, "resets_at": "2026-02-17T00:00:00+00:00"},
+    "seven_day_opus": None,
+}
+
+
+async def test_push_updates_coordinator(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a valid push replaces the data and is cached."""
+    client = await hass_client_no_auth()
+
+    resp = await client.post(WEBHOOK_URL, json=PUSHED_USAGE)
+    assert resp.status == HTTPStatus.OK
+
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    assert coordinator.data == PUSHED_USAGE
+
+    # The snapshot is written after a delay, not on every push
+    assert f"{DOMAIN}.{setup_integration.entry_id}" not in hass_storage
+
+    await coordinator.async_flush_cache()
+    stored = hass_storage[f"{DOMAIN}.{setup_integration.entry_id}"]["data"]
+    assert stored["data"] == PUSHED_USAGE
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        ["not", "a", "dict"],
+        {"five_hour": MOCK_USAGE_RESPONSE["five_hour"]},
+        {**PUSHED_USAGE, "five_hour": {"utilization": "lots", "resets_at": None}},
+        {**PUSHED_USAGE, "five_hour": {"utilization": "nan", "resets_at": None}},
+        {**PUSHED_USAGE, "five_hour": {"utilization": "inf", "resets_at": None}},
+        {**PUSHED_USAGE, "seven_day": {"utilization": "-inf", "resets_at": None}},
+        {**PUSHED_USAGE, "seven_day": {"utilization": -1.0, "resets_at": None}},
+        {**PUSHED_USAGE, "seven_day": {"utilization": 1.0, "resets_at": "soon"}},
+        {
+            **PUSHED_USAGE,
+            "five_hour": {"utilization": 1.0, "resets_at": "2026-02-10T15:30:00"},
+        },
+        {**PUSHED_USAGE, "five_hour": {"utilization": 1.0, "resets_at": "2026-02-10"}},
+        {
+            **PUSHED_USAGE,
+            "seven_day": {"utilization": 1.0, "resets_at": "2026-02-10T25:00:00"},
+        },
+    ],
+)
+async def test_push_rejects_invalid_payload(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    hass_client_no_auth: ClientSessionGenerator,
+    payload: Any,
+) -> None:
+    """Test malformed payloads are rejected and leave the data untouched."""
+    client = await hass_client_no_auth()
+
+    resp = await client.post(WEBHOOK_URL, json=payload)
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    assert coordinator.data == MOCK_USAGE_RESPONSE
+
+
+async def test_push_rejects_invalid_json(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    hass_client_no_auth: ClientSessionGenerator,
+) -> None:
+    """Test a body that is not JSON is rejected."""
+    client = await hass_client_no_auth()
+
+    resp = await client.post(WEBHOOK_URL, data=b"{not json")
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_push_holds_off_polling(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    setup_integration: MockConfigEntry,
+    mock_api: AiohttpClientMocker,
+    hass_client_no_auth: ClientSessionGenerator,
+) -> None:
+    """Test polling resumes only once pushes stop for the push window."""
+    client = await hass_client_no_auth()
+    assert mock_api.call_count == 2
+
+    for _ in range(3):
+        freezer.tick(timedelta(minutes=10))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        resp = await client.post(WEBHOOK_URL, json=PUSHED_USAGE)
+        assert resp.status == HTTPStatus.OK
+
+    # The first tick polls before the first push lands
+    assert mock_api.call_count == 3
+
+    freezer.tick(timedelta(minutes=14))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 3
+
+    freezer.tick(timedelta(minutes=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert mock_api.call_count == 4
+
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    assert coordinator.data == MOCK_USAGE_RESPONSE
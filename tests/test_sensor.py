@@ -1,10 +1,19 @@
 """Tests for Claude Usage sensor entities."""
 
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.claude_usage.const import DOMAIN
+from custom_components.claude_usage.sensor import _next_countdown_update
 
 
 def _get_entity_id_by_key(
@@ -68,11 +77,76 @@ async def test_entities_registered(
     setup_integration: MockConfigEntry,
     entity_registry: er.EntityRegistry,
 ) -> None:
-    """Test all 4 entities are registered under the integration."""
+    """Test all entities are registered under the integration."""
     entries = er.async_entries_for_config_entry(
         entity_registry, setup_integration.entry_id
     )
-    assert len(entries) == 4
+    assert len(entries) == 10
 
     keys = {e.unique_id.split("_", 1)[1] for e in entries}
-    assert keys == {"session_usage", "weekly_usage", "session_reset", "weekly_reset"}
+    assert keys == {
+        "session_usage",
+        "weekly_usage",
+        "session_reset",
+        "weekly_reset",
+        "session_countdown",
+        "weekly_countdown",
+        "session_headroom",
+        "weekly_headroom",
+        "session_window",
+        "weekly_window",
+    }
+
+
+@pytest.mark.freeze_time("2026-02-10T12:00:00+00:00")
+async def test_countdown_and_headroom(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    setup_integration: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test countdown and headroom follow the clock between polls."""
+    eid = setup_integration.entry_id
+    countdown_id = _get_entity_id_by_key(entity_registry, eid, "session_countdown")
+    headroom_id = _get_entity_id_by_key(entity_registry, eid, "session_headroom")
+    weekly_countdown_id = _get_entity_id_by_key(
+        entity_registry, eid, "weekly_countdown"
+    )
+
+    assert hass.states.get(countdown_id).state == "210"
+    assert hass.states.get(headroom_id).state == "55.0"
+    assert hass.states.get(weekly_countdown_id).state == str(6 * 24 * 60 + 12 * 60)
+
+    # Three and a half hours out the countdown steps in quarter hours
+    freezer.tick(timedelta(minutes=14))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(countdown_id).state == "210"
+
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(countdown_id).state == "195"
+
+    # Past the reset the window is empty even before the next poll lands
+    freezer.move_to("2026-02-10T15:30:00+00:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(countdown_id).state == "0"
+    assert hass.states.get(headroom_id).state == "100.0"
+
+
+def test_next_countdown_update_granularity() -> None:
+    """Test countdown updates are coarse far from the reset and fine near it."""
+    resets_at = dt_util.parse_datetime("2026-02-17T00:00:00+00:00")
+
+    now = resets_at - timedelta(days=3, minutes=20)
+    assert _next_countdown_update(now, resets_at) == now + timedelta(minutes=20)
+
+    now = resets_at - timedelta(hours=5, minutes=20)
+    assert _next_countdown_update(now, resets_at) == now + timedelta(minutes=5)
+
+    now = resets_at - timedelta(minutes=30, seconds=20)
+    assert _next_countdown_update(now, resets_at) == now + timedelta(seconds=20)
+
+    assert _next_countdown_update(resets_at, resets_at) is None
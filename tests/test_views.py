@@ -0,0 +1,130 @@
+"""Tests for the Claude Usage history export view."""
+
+from http import HTTPStatus
+import json
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.claude_usage.const import DOMAIN
+
+from .conftest import MOCK_USAGE_RESPONSE
+
+
+pytestmark = pytest.mark.freeze_time("2026-02-10T12:00:00+00:00")
+
+
+@pytest.fixture
+async def history_entry(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    setup_integration: MockConfigEntry,
+) -> MockConfigEntry:
+    """Set up the integration with a sample at 12:00 and another at 12:04."""
+    freezer.move_to("2026-02-10T12:04:00+00:00")
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    coordinator.history.async_record(
+        {**MOCK_USAGE_RESPONSE, "seven_day": {"utilization": 73.0, "resets_at": None}}
+    )
+    return setup_integration
+
+
+async def test_export_ndjson(
+    hass: HomeAssistant,
+    history_entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test history streams as one JSON object per line by default."""
+    client = await hass_client()
+
+    resp = await client.get(f"/api/claude_usage/history/{history_entry.entry_id}")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in (await resp.text()).splitlines()]
+    assert rows == [
+        {
+            "time": "2026-02-10T12:00:00+00:00",
+            "event": "sample",
+            "five_hour": 45.0,
+            "seven_day": 72.0,
+        },
+        {
+            "time": "2026-02-10T12:04:00+00:00",
+            "event": "sample",
+            "five_hour": 45.0,
+            "seven_day": 73.0,
+        },
+    ]
+
+
+async def test_export_csv_range(
+    hass: HomeAssistant,
+    history_entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test CSV output honours the start time."""
+    client = await hass_client()
+
+    resp = await client.get(
+        f"/api/claude_usage/history/{history_entry.entry_id}",
+        params={"format": "csv", "start": "2026-02-10T12:02:00+00:00"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Type"] == "text/csv"
+    assert (await resp.text()).splitlines() == [
+        "time,event,period,five_hour,seven_day,utilization",
+        "2026-02-10T12:04:00+00:00,sample,,45.0,73.0,",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("params", "status"),
+    [
+        ({"format": "xml"}, HTTPStatus.BAD_REQUEST),
+        ({"start": "yesterday"}, HTTPStatus.BAD_REQUEST),
+        ({"end": "2026-02-10T25:00:00"}, HTTPStatus.BAD_REQUEST),
+    ],
+)
+async def test_export_bad_request(
+    hass: HomeAssistant,
+    history_entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+    params: dict[str, str],
+    status: HTTPStatus,
+) -> None:
+    """Test invalid query parameters are rejected."""
+    client = await hass_client()
+
+    resp = await client.get(
+        f"/api/claude_usage/history/{history_entry.entry_id}", params=params
+    )
+    assert resp.status == status
+
+
+async def test_export_unknown_entry(
+    hass: HomeAssistant,
+    history_entry: MockConfigEntry,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test an unknown entry ID returns 404."""
+    client = await hass_client()
+
+    resp = await client.get("/api/claude_usage/history/not-an-entry")
+    assert resp.status == HTTPStatus.NOT_FOUND
+
+
+async def test_export_requires_auth(
+    hass: HomeAssistant,
+    history_entry: MockConfigEntry,
+    hass_client_no_auth: ClientSessionGenerator,
+) -> None:
+    """Test the view rejects unauthenticated requests."""
+    client = await hass_client_no_auth()
+
+    resp = await client.get(f"/api/claude_usage/history/{history_entry.entry_id}")
+    assert resp.status == HTTPStatus.UNAUTHORIZED